@@ -4,46 +4,46 @@ use criterion::{black_box, criterion_group, criterion_main, Criterion};
 
 fn criterion_benchmark(c: &mut Criterion) {
     let projects = vec![
-        include_bytes!("../tests/data/vb6-code/Artificial-life/Artificial Life.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Blacklight-effect/Blacklight.vbp").to_vec(),
+        include_bytes!("../tests/data/vb6-code/Artificial-life/Artificial Life.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Blacklight-effect/Blacklight.vbp").as_slice(),
         include_bytes!("../tests/data/vb6-code/Brightness-effect/Part 1 - Pure VB6/Brightness.vbp")
-            .to_vec(),
-        include_bytes!("../tests/data/vb6-code/Brightness-effect/Part 2 - API - GetPixel and SetPixel/Brightness2.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Brightness-effect/Part 3 - DIBs/Brightness3.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Color-shift-effect/ShiftColor.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Colorize-effect/Colorize.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Contrast-effect/Contrast.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Curves-effect/Curves.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Custom-image-filters/CustomFilters.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Diffuse-effect/Diffuse.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Edge-detection/EdgeDetection.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Emboss-engrave-effect/EmbossEngrave.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Fill-image-region/Fill_Region.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Fire-effect/FlameTest.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Game-physics-basic/Physics.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Gradient-2D/Gradient.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Grayscale-effect/Grayscale.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Hidden-Markov-model/HMM.vbp").to_vec(),
+            .as_slice(),
+        include_bytes!("../tests/data/vb6-code/Brightness-effect/Part 2 - API - GetPixel and SetPixel/Brightness2.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Brightness-effect/Part 3 - DIBs/Brightness3.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Color-shift-effect/ShiftColor.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Colorize-effect/Colorize.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Contrast-effect/Contrast.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Curves-effect/Curves.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Custom-image-filters/CustomFilters.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Diffuse-effect/Diffuse.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Edge-detection/EdgeDetection.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Emboss-engrave-effect/EmbossEngrave.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Fill-image-region/Fill_Region.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Fire-effect/FlameTest.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Game-physics-basic/Physics.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Gradient-2D/Gradient.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Grayscale-effect/Grayscale.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Hidden-Markov-model/HMM.vbp").as_slice(),
         include_bytes!("../tests/data/vb6-code/Histograms-advanced/Advanced Histograms.vbp")
-            .to_vec(),
-        include_bytes!("../tests/data/vb6-code/Histograms-basic/Basic Histograms.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Levels-effect/Image Levels.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Mandelbrot/Mandelbrot.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Map-editor-2D/Map Editor.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Nature-effects/NatureFilters.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Randomize-effects/RandomizationFX.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Scanner-TWAIN/VB_Scanner_Support.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Screen-capture/ScreenCapture.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Sepia-effect/Sepia.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Threshold-effect/Threshold.vbp").to_vec(),
-        include_bytes!("../tests/data/vb6-code/Transparency-2D/Transparency.vbp").to_vec(),
+            .as_slice(),
+        include_bytes!("../tests/data/vb6-code/Histograms-basic/Basic Histograms.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Levels-effect/Image Levels.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Mandelbrot/Mandelbrot.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Map-editor-2D/Map Editor.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Nature-effects/NatureFilters.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Randomize-effects/RandomizationFX.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Scanner-TWAIN/VB_Scanner_Support.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Screen-capture/ScreenCapture.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Sepia-effect/Sepia.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Threshold-effect/Threshold.vbp").as_slice(),
+        include_bytes!("../tests/data/vb6-code/Transparency-2D/Transparency.vbp").as_slice(),
     ];
 
     c.bench_function("load multiple projects", |b| {
         b.iter(|| {
             for project in &projects {
                 black_box({
-                    let _proj = VB6Project::parse(project.as_slice());
+                    let _proj = VB6Project::parse(project);
                 });
             }
         })
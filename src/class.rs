@@ -6,7 +6,7 @@ use crate::vb6::eol_comment_parse;
 
 use winnow::{
     ascii::{digit1, line_ending, space0, space1, Caseless},
-    combinator::{opt, repeat_till},
+    combinator::opt,
     error::{ContextError, ErrMode, ParserError, StrContext, StrContextValue},
     token::{literal, take_while},
     PResult, Parser,
@@ -24,15 +24,6 @@ pub struct VB6ClassHeader<'a> {
     pub option_explicit: bool, // Option Explicit, or Option Explicit ON, or Option Explicit OFF. This must be before any other line in the file (except comments)
 }
 
-#[derive(Debug, PartialEq, Eq, Clone)]
-pub struct VB6ClassAttributes<'a> {
-    pub name: &'a [u8],          // Attribute VB_Name = "Organism"
-    pub global_name_space: bool, // (True/False) Attribute VB_GlobalNameSpace = False
-    pub creatable: bool,         // (True/False) Attribute VB_Creatable = True
-    pub pre_declared_id: bool,   // (True/False) Attribute VB_PredeclaredId = False
-    pub exposed: bool,           // (True/False) Attribute VB_Exposed = False
-}
-
 #[derive(Debug, PartialEq, Eq, Clone)]
 pub struct VB6ClassFile<'a> {
     pub header: VB6ClassHeader<'a>,
@@ -84,11 +75,19 @@ fn class_header_parse<'a>(input: &mut &'a [u8]) -> PResult<VB6ClassHeader<'a>> {
     let mut data_source_behavior = false;
     let mut mts_transaction_mode = false;
 
-    let (collection, _): (Vec<(&[u8], &[u8])>, &[u8]) =
-        repeat_till(0.., key_value_line_parse(b"="), keyword_parse("END")).parse_next(input)?;
+    // Dispatch each key/value line as soon as it is parsed instead of
+    // collecting the whole header into an intermediate Vec and scanning
+    // it in a second loop. The parsers themselves don't change from line
+    // to line, so build them once up front.
+    let mut end_keyword = keyword_parse("END");
+    let mut header_line = key_value_line_parse(b"=");
 
-    for pair in collection.iter() {
-        let (key, value) = *pair;
+    loop {
+        if end_keyword.parse_next(input).is_ok() {
+            break;
+        }
+
+        let (key, value) = header_line.parse_next(input)?;
 
         match key {
             b"Persistable" => {
@@ -139,9 +138,11 @@ fn attributes_parse<'a>(input: &mut &'a [u8]) -> PResult<VB6FileAttributes<'a>>
     let mut pre_declared_id = false;
     let mut exposed = false;
 
-    while let Ok((_, (key, value))) =
-        (keyword_parse("Attribute"), key_value_parse(b"=")).parse_next(input)
-    {
+    // One attribute-line parser serves the whole loop; no need to rebuild
+    // it for every line.
+    let mut attribute_line = (keyword_parse("Attribute"), key_value_parse(b"="));
+
+    while let Ok((_, (key, value))) = attribute_line.parse_next(input) {
         line_ending
             .context(StrContext::Label(
                 "Newline expected after Class File Attribute line.",
@@ -250,8 +251,13 @@ fn version_parse<'a>(input: &mut &'a [u8]) -> PResult<VB6ClassVersion> {
         .context(StrContext::Label("Major version number not found."))
         .parse_next(input)?;
 
-    let major_version =
-        u16::from_str_radix(bstr::BStr::new(major_digits).to_string().as_str(), 10).unwrap();
+    // digit1 only ever matches ASCII digits, so the utf8 check can't fail
+    // and we can parse straight from the matched bytes without building an
+    // intermediate String.
+    let major_version = core::str::from_utf8(major_digits)
+        .unwrap()
+        .parse::<u16>()
+        .unwrap();
 
     b".".context(StrContext::Label("Version decimal character not found."))
         .parse_next(input)?;
@@ -260,8 +266,10 @@ fn version_parse<'a>(input: &mut &'a [u8]) -> PResult<VB6ClassVersion> {
         .context(StrContext::Label("Minor version number not found."))
         .parse_next(input)?;
 
-    let minor_version =
-        u16::from_str_radix(bstr::BStr::new(minor_digits).to_string().as_str(), 10).unwrap();
+    let minor_version = core::str::from_utf8(minor_digits)
+        .unwrap()
+        .parse::<u16>()
+        .unwrap();
 
     space1(input)?;
 
@@ -2,9 +2,8 @@
 use bstr::{BStr, ByteSlice};
 use uuid::Uuid;
 use winnow::{
-    combinator::{alt, rest, separated_pair},
-    error::{ErrMode, ParserError},
-    token::{literal, take_until, take_while},
+    error::ErrMode,
+    token::{literal, take_until},
     PResult, Parser,
 };
 
@@ -313,32 +312,32 @@ impl<'a> VB6Project<'a> {
                     Err(_) => return Err(VB6ProjectParseError::CompatibilityModeUnparseable),
                 },
                 b"MajorVer" => {
-                    let Ok(major_ver) = value.to_str() else {
+                    let Some(major_ver) = ascii_u16_parse(value) else {
                         return Err(VB6ProjectParseError::MajorVersionUnparseable);
                     };
 
-                    major = major_ver.parse().unwrap();
+                    major = major_ver;
                 }
                 b"MinorVer" => {
-                    let Ok(minor_ver) = value.to_str() else {
+                    let Some(minor_ver) = ascii_u16_parse(value) else {
                         return Err(VB6ProjectParseError::MinorVersionUnparseable);
                     };
 
-                    minor = minor_ver.parse().unwrap();
+                    minor = minor_ver;
                 }
                 b"RevisionVer" => {
-                    let Ok(revision_ver) = value.to_str() else {
-                        return Err(VB6ProjectParseError::MinorVersionUnparseable);
+                    let Some(revision_ver) = ascii_u16_parse(value) else {
+                        return Err(VB6ProjectParseError::RevisionVersionUnparseable);
                     };
 
-                    revision = revision_ver.parse().unwrap();
+                    revision = revision_ver;
                 }
                 b"AutoIncrementVer" => {
-                    let Ok(auto_increment) = value.to_str() else {
+                    let Some(auto_increment) = ascii_u16_parse(value) else {
                         return Err(VB6ProjectParseError::AutoIncrementUnparseable);
                     };
 
-                    auto_increment_revision = auto_increment.parse().unwrap();
+                    auto_increment_revision = auto_increment;
                 }
                 b"NoControlUpgrade" => {
                     match true_false_parse(&mut value) {
@@ -462,18 +461,18 @@ impl<'a> VB6Project<'a> {
                     Err(_) => return Err(VB6ProjectParseError::RetainedUnparseable),
                 },
                 b"ThreadPerObject" => {
-                    let Ok(threads) = value.to_str() else {
+                    let Some(threads) = ascii_u16_parse(value) else {
                         return Err(VB6ProjectParseError::ThreadPerObjectUnparseable);
                     };
 
-                    thread_per_object = threads.parse().unwrap();
+                    thread_per_object = threads;
                 }
                 b"MaxNumberOfThreads" => {
-                    let Ok(max_threads) = value.to_str() else {
+                    let Some(max_threads) = ascii_u16_parse(value) else {
                         return Err(VB6ProjectParseError::MaxThreadsUnparseable);
                     };
 
-                    max_number_of_threads = max_threads.parse().unwrap();
+                    max_number_of_threads = max_threads;
                 }
                 b"DebugStartupOption" => match true_false_parse(&mut value) {
                     Ok(val) => debug_startup_option = val,
@@ -575,19 +574,53 @@ impl<'a> VB6Project<'a> {
 
 type KVTuple<'a> = (&'a [u8], &'a [u8]);
 
+/// Parses a base ten `u16` directly from ASCII digit bytes.
+///
+/// Returns `None` if the input is empty, contains anything besides ASCII
+/// digits, or overflows a `u16`. This saves validating the value as utf8
+/// just to hand it to `str::parse`, and turns what used to be a panic on
+/// a bad number into an error the caller can report.
+fn ascii_u16_parse(input: &[u8]) -> Option<u16> {
+    if input.is_empty() {
+        return None;
+    }
+
+    let mut result: u16 = 0;
+
+    for digit in input {
+        if !digit.is_ascii_digit() {
+            return None;
+        }
+
+        result = result
+            .checked_mul(10)?
+            .checked_add(u16::from(digit - b'0'))?;
+    }
+
+    Some(result)
+}
+
 fn key_value_parse<'a>(
     input: &mut &'a [u8],
     split: &[u8],
 ) -> PResult<KVTuple<'a>, VB6ProjectParseError<&'a [u8]>> {
-    // Normally we would expect a key to be just an alphanumeric, but the
-    // VB6 Project format includes this lovely gem of a line:
+    // A key can contain more than just alphanumerics. The VB6 Project
+    // format includes this lovely gem of a line:
     //
     // ```FavorPentiumPro(tm)=0```
     //
-    // So we have to include the '(' and the ')' characters in the key split.
-    let take_key_valid_parse = take_while(1.., ('0'..='9', 'a'..='z', 'A'..='Z', '(', ')'));
+    // So rather than tokenizing the key with an ever-growing character
+    // class, we just scan once for the divider; everything before it is
+    // the key and everything after it is the value. The big key match in
+    // `parse` takes care of rejecting anything unexpected.
+    let Some(index) = input.find(split) else {
+        return Err(ErrMode::Cut(VB6ProjectParseError::NoEqualSplit));
+    };
+
+    let key = &input[..index];
+    let value = &input[index + split.len()..];
 
-    let (key, value) = separated_pair(take_key_valid_parse, split, rest).parse_next(input)?;
+    *input = b"";
 
     Ok((key, value))
 }
@@ -595,7 +628,16 @@ fn key_value_parse<'a>(
 fn true_false_parse<'a>(input: &mut &'a [u8]) -> PResult<bool, VB6ProjectParseError<&'a [u8]>> {
     // 0 is false...and -1 is true.
     // Why vb6? What are you like this? Who hurt you?
-    let result = alt(('0'.value(false), "-1".value(true))).parse_next(input)?;
+    //
+    // The value is just the remainder of the line, so a literal comparison
+    // is all that's needed here.
+    let result = match *input {
+        b"0" => false,
+        b"-1" => true,
+        _ => return Err(ErrMode::Backtrack(VB6ProjectParseError::Unparseable)),
+    };
+
+    *input = b"";
 
     Ok(result)
 }
@@ -604,7 +646,13 @@ fn auto_refresh_parse<'a>(input: &mut &'a [u8]) -> PResult<bool, VB6ProjectParse
     // 0 is false...and 1 is true.
     // Of course, VB6 being VB6, this is the only entry that does something different.
     // le sigh.
-    let result = alt(('0'.value(false), "1".value(true))).parse_next(input)?;
+    let result = match *input {
+        b"0" => false,
+        b"1" => true,
+        _ => return Err(ErrMode::Backtrack(VB6ProjectParseError::Unparseable)),
+    };
+
+    *input = b"";
 
     Ok(result)
 }
@@ -613,9 +661,8 @@ fn qouted_true_false_parse<'a>(
     input: &mut &'a [u8],
 ) -> PResult<bool, VB6ProjectParseError<&'a [u8]>> {
     let mut qoute = qouted_value(input, b"\"")?;
-    // 0 is false...and -1 is true.
-    // Why vb6? What are you like this? Who hurt you?
-    let result = alt(('0'.value(false), "-1".value(true))).parse_next(&mut qoute)?;
+
+    let result = true_false_parse(&mut qoute)?;
 
     Ok(result)
 }
@@ -784,21 +831,20 @@ fn project_type_parse<'a>(
     //
     // By this point in the parse the "Type=" component should be stripped off
     // since that is how we knew to use this particular parse.
-    let project_type = match alt((
-        b"Exe".value(ProjectType::Exe),
-        b"Control".value(ProjectType::Control),
-        b"OleExe".value(ProjectType::OleExe),
-        b"OleDll".value(ProjectType::OleDll),
-    ))
-    .parse_next(input)
-    {
-        Ok(type_project) => type_project,
-        Err(e) => {
-            let inner = e.or(ErrMode::Cut(VB6ProjectParseError::ProjectTypeUnknown));
-            return Err(inner);
-        }
+    //
+    // A straight match on the value beats trying each literal in turn; the
+    // value is the remainder of the line, so anything but an exact project
+    // type is an error anyway.
+    let project_type = match *input {
+        b"Exe" => ProjectType::Exe,
+        b"Control" => ProjectType::Control,
+        b"OleExe" => ProjectType::OleExe,
+        b"OleDll" => ProjectType::OleDll,
+        _ => return Err(ErrMode::Cut(VB6ProjectParseError::ProjectTypeUnknown)),
     };
 
+    *input = b"";
+
     Ok(project_type)
 }
 